@@ -35,7 +35,10 @@ class BarterContract(sp.Contract):
         # Define the contract storage data types for clarity
         self.init_type(sp.TRecord(
             manager=sp.TAddress,
-            allowed_fa2s=sp.TBigMap(sp.TAddress, sp.TBool),
+            # The allowed FA2s are kept in a normal map, since the list of
+            # tradable tokens is expected to stay small and curated by the
+            # manager, and map reads are cheaper than big map lookups
+            allowed_fa2s=sp.TMap(sp.TAddress, sp.TBool),
             trades=sp.TBigMap(sp.TNat, sp.TRecord(
                 user1_accepted=sp.TBool,
                 user2_accepted=sp.TBool,
@@ -78,12 +81,13 @@ class BarterContract(sp.Contract):
         not been executed.
 
         """
-        # Check that the trade id is present in the trades big map
-        sp.verify(self.data.trades.contains(trade_id),
-                  message="The provided trade id doesn't exist")
+        # A single big map lookup both checks that the trade id is present in
+        # the trades big map and returns the trade information
+        trade = sp.compute(self.data.trades.get(
+            trade_id, message="The provided trade id doesn't exist"))
 
         # Check that the trade was not executed before
-        sp.verify(~self.data.trades[trade_id].executed,
+        sp.verify(~trade.executed,
                   message="The trade was executed before")
 
     @sp.entry_point
@@ -110,29 +114,22 @@ class BarterContract(sp.Contract):
             sp.verify(self.data.allowed_fa2s.get(token.fa2, default_value=False),
                       message="This token type cannot be traded")
 
-            # Check that at least one edition will be traded
-            sp.verify(token.amount >= 0,
-                      message="At least one token edition needs to be traded")
-
         # Loop over the second user token list
         sp.for token in trade_proposal.tokens2:
             # Check that the token is one of the allowed tokens to trade
             sp.verify(self.data.allowed_fa2s.get(token.fa2, default_value=False),
                       message="This token type cannot be traded")
 
-            # Check that at least one edition will be traded
-            sp.verify(token.amount >= 0,
-                      message="At least one token edition needs to be traded")
-
         # Update the trades bigmap with the new trade information
-        self.data.trades[self.data.counter] = sp.record(
+        trade_id = sp.compute(self.data.counter)
+        self.data.trades[trade_id] = sp.record(
             user1_accepted=False,
             user2_accepted=False,
             executed=False,
             proposal=trade_proposal)
 
         # Increase the trades counter
-        self.data.counter += 1
+        self.data.counter = trade_id + 1
 
     @sp.entry_point
     def accept_trade(self, trade_id):
@@ -164,13 +161,10 @@ class BarterContract(sp.Contract):
                       message="The sent tez amount does not coincide trade proposal amount")
 
             # Transfer all the editions to the barter account
-            sp.for token in trade.proposal.tokens1:
-                self.fa2_transfer(
-                    fa2=token.fa2,
-                    from_=sp.sender,
-                    to_=sp.self_address,
-                    token_id=token.id,
-                    token_amount=token.amount)
+            self.transfer_tokens(
+                from_=sp.sender,
+                to_=sp.self_address,
+                tokens=trade.proposal.tokens1)
         sp.else:
             # Check that the user didn't accept the trade before
             sp.verify(~trade.user2_accepted,
@@ -183,13 +177,10 @@ class BarterContract(sp.Contract):
             self.check_no_tez_transfer()
 
             # Transfer all the editions to the barter account
-            sp.for token in trade.proposal.tokens2:
-                self.fa2_transfer(
-                    fa2=token.fa2,
-                    from_=sp.sender,
-                    to_=sp.self_address,
-                    token_id=token.id,
-                    token_amount=token.amount)
+            self.transfer_tokens(
+                from_=sp.sender,
+                to_=sp.self_address,
+                tokens=trade.proposal.tokens2)
 
     @sp.entry_point
     def cancel_trade(self, trade_id):
@@ -223,13 +214,10 @@ class BarterContract(sp.Contract):
                 sp.send(sp.sender, trade.proposal.mutez_amount)
 
             # Return all the editions to the user account
-            sp.for token in trade.proposal.tokens1:
-                self.fa2_transfer(
-                    fa2=token.fa2,
-                    from_=sp.self_address,
-                    to_=sp.sender,
-                    token_id=token.id,
-                    token_amount=token.amount)
+            self.transfer_tokens(
+                from_=sp.self_address,
+                to_=sp.sender,
+                tokens=trade.proposal.tokens1)
         sp.else:
             # Check that the user accepted the trade before
             sp.verify(trade.user2_accepted,
@@ -239,13 +227,10 @@ class BarterContract(sp.Contract):
             trade.user2_accepted = False
 
             # Return all the editions to the user account
-            sp.for token in trade.proposal.tokens2:
-                self.fa2_transfer(
-                    fa2=token.fa2,
-                    from_=sp.self_address,
-                    to_=sp.sender,
-                    token_id=token.id,
-                    token_amount=token.amount)
+            self.transfer_tokens(
+                from_=sp.self_address,
+                to_=sp.sender,
+                tokens=trade.proposal.tokens2)
 
     @sp.entry_point
     def execute_trade(self, trade_id):
@@ -277,22 +262,16 @@ class BarterContract(sp.Contract):
             sp.send(trade.proposal.user2, trade.proposal.mutez_amount)
 
         # Transfer the first user tokens to the second user
-        sp.for token in trade.proposal.tokens1:
-            self.fa2_transfer(
-                fa2=token.fa2,
-                from_=sp.self_address,
-                to_=trade.proposal.user2,
-                token_id=token.id,
-                token_amount=token.amount)
+        self.transfer_tokens(
+            from_=sp.self_address,
+            to_=trade.proposal.user2,
+            tokens=trade.proposal.tokens1)
 
         # Transfer the second user tokens to the first user
-        sp.for token in trade.proposal.tokens2:
-            self.fa2_transfer(
-                fa2=token.fa2,
-                from_=sp.self_address,
-                to_=trade.proposal.user1,
-                token_id=token.id,
-                token_amount=token.amount)
+        self.transfer_tokens(
+            from_=sp.self_address,
+            to_=trade.proposal.user1,
+            tokens=trade.proposal.tokens2)
 
     @sp.entry_point
     def update_manager(self, manager):
@@ -345,6 +324,18 @@ class BarterContract(sp.Contract):
         # Dissable the FA2 token address
         self.data.allowed_fa2s[fa2] = False
 
+    def transfer_tokens(self, from_, to_, tokens):
+        """Transfers a list of FA2 tokens between two addresses.
+
+        """
+        sp.for token in tokens:
+            self.fa2_transfer(
+                fa2=token.fa2,
+                from_=from_,
+                to_=to_,
+                token_id=token.id,
+                token_amount=token.amount)
+
     def fa2_transfer(self, fa2, from_, to_, token_id, token_amount):
         """Transfers a number of editions of a FA2 token between two addresses.
 
@@ -375,4 +366,4 @@ class BarterContract(sp.Contract):
 # Add a compilation target initialized to a test account and the OBJKT FA2 contract
 sp.add_compilation_target("barter", BarterContract(
     manager=sp.address("tz1gnL9CeM5h5kRzWZztFYLypCNnVQZjndBN"),
-    allowed_fa2s=sp.big_map({sp.address("KT1RJ6PbjHpwc3M5rw5s2Nbmefwbuwbdxton"): True})))
+    allowed_fa2s=sp.map({sp.address("KT1RJ6PbjHpwc3M5rw5s2Nbmefwbuwbdxton"): True})))
@@ -48,13 +48,13 @@ class CollaborationContract(sp.Contract):
         """Checks that the proposal_id is from a valid proposal.
 
         """
-        # Check that the proposal id is present in the proposals big map
-        sp.verify(self.data.proposals.contains(proposal_id),
-                  message="COLLAB_INEXISTENT_PROPOSAL")
+        # A single big map lookup both checks that the proposal id is present
+        # in the proposals big map and returns the proposal information
+        proposal = sp.compute(self.data.proposals.get(
+            proposal_id, message="COLLAB_INEXISTENT_PROPOSAL"))
 
         # Check that the proposal has not been executed
-        sp.verify(~self.data.proposals[proposal_id].executed,
-                  message="COLLAB_EXECUTED_PROPOSAL")
+        sp.verify(~proposal.executed, message="COLLAB_EXECUTED_PROPOSAL")
 
     @sp.entry_point
     def default(self, unit):
@@ -122,17 +122,18 @@ class CollaborationContract(sp.Contract):
             message="COLLAB_INEXISTENT_LAMBDA")
 
         # Update the proposals bigmap with the new proposal information
-        self.data.proposals[self.data.counter] = sp.record(
+        proposal_id = sp.compute(self.data.counter)
+        self.data.proposals[proposal_id] = sp.record(
             executed=False,
             approvals=1,
             lambda_id=params.lambda_id,
             parameters=params.parameters)
 
         # Assume that the collaborator approves their own proposal
-        self.data.approvals[(self.data.counter, sp.sender)] = True
+        self.data.approvals[(proposal_id, sp.sender)] = True
 
         # Increase the proposals counter
-        self.data.counter += 1
+        self.data.counter = proposal_id + 1
 
     @sp.entry_point
     def approve(self, params):
@@ -263,7 +264,8 @@ class CollabOriginatorContract(sp.Contract):
         sp.verify(total_shares.value == 1000, message="ORIGINATOR_WRONG_SHARES")
 
         # Create the new contract and add it to the collaborations big map
-        self.data.collaborations[self.data.counter] = sp.create_contract(
+        collaboration_id = sp.compute(self.data.counter)
+        self.data.collaborations[collaboration_id] = sp.create_contract(
             contract=self.contract,
             storage=sp.record(
                 metadata=params.metadata,
@@ -277,7 +279,7 @@ class CollabOriginatorContract(sp.Contract):
             amount=sp.mutez(0))
 
         # Increase the collaborations counter
-        self.data.counter += 1
+        self.data.counter = collaboration_id + 1
 
 
 class LambdaProviderContract(sp.Contract):
@@ -398,15 +400,15 @@ class LambdaProviderContract(sp.Contract):
         # Define the input parameter data type
         sp.set_type(lambda_id, sp.TNat)
 
-        # Check that the lambda function is present in the lambdas big map
-        self.check_lambda_exists(lambda_id)
+        # Get the lambda record with a single big map lookup
+        lambda_record = sp.compute(self.data.lambdas.get(
+            lambda_id, message="PROXY_INEXISTENT_LAMBDA"))
 
         # Check that the lambda function is enabled
-        sp.verify(self.data.lambdas[lambda_id].enabled,
-                  message="PROXY_DISABLED_LAMBDA")
+        sp.verify(lambda_record.enabled, message="PROXY_DISABLED_LAMBDA")
 
         # Return the lambda function
-        sp.result(self.data.lambdas[lambda_id].lambda_function)
+        sp.result(lambda_record.lambda_function)
 
     @sp.entry_point
     def transfer_administrator(self, proposed_administrator):
@@ -428,13 +430,12 @@ class LambdaProviderContract(sp.Contract):
         responsabilities.
 
         """
-        # Check that there is a proposed administrator
-        sp.verify(self.data.proposed_administrator.is_some(),
-                  message="PROXY_NO_NEW_ADMIN")
-
-        # Check that the proposed administrator executed the entry point
-        sp.verify(sp.sender == self.data.proposed_administrator.open_some(),
-                  message="PROXY_NOT_PROPOSED_ADMIN")
+        # Check that there is a proposed administrator and that it executed
+        # the entry point, unwrapping the option in a single step
+        sp.verify(
+            sp.sender == self.data.proposed_administrator.open_some(
+                message="PROXY_NO_NEW_ADMIN"),
+            message="PROXY_NOT_PROPOSED_ADMIN")
 
         # Set the new administrator address
         self.data.administrator = sp.sender
@@ -49,6 +49,27 @@ class FA2(sp.Contract):
         token_id=sp.TNat).layout(
             ("owner", ("operator", "token_id")))
 
+    # The static part of the TZIP-016 contract metadata
+    # It is built only once, instead of at each contract instantiation
+    CONTRACT_METADATA_BASE = {
+        "name": "Extended FA2 template contract",
+        "description" : "This contract tries to simplify and extend the "
+            "FA2 contract template example in smartpy.io v0.9.1",
+        "version": "v1.0.0",
+        "authors": ["Javier Gracia Carpio <https://twitter.com/jagracar>"],
+        "homepage": "https://github.com/jagracar/tezos-smart-contracts",
+        "source": {
+            "tools": ["SmartPy 0.9.1"],
+            "location": "https://github.com/jagracar/tezos-smart-contracts/blob/main/python/contracts/extendedFa2Contract.py"
+        },
+        "interfaces": ["TZIP-012", "TZIP-016"],
+        "permissions": {
+            "operator": "owner-or-operator-transfer",
+            "receiver": "owner-no-hook",
+            "sender": "owner-no-hook"
+        }
+    }
+
     def __init__(self, administrator, metadata):
         """Initializes the contract.
 
@@ -91,32 +112,17 @@ class FA2(sp.Contract):
 
         # Build the TZIP-016 contract metadata
         # This is helpful to get the off-chain views code in json format
-        contract_metadata = {
-            "name": "Extended FA2 template contract",
-            "description" : "This contract tries to simplify and extend the "
-                "FA2 contract template example in smartpy.io v0.9.1",
-            "version": "v1.0.0",
-            "authors": ["Javier Gracia Carpio <https://twitter.com/jagracar>"],
-            "homepage": "https://github.com/jagracar/tezos-smart-contracts",
-            "source": {
-                "tools": ["SmartPy 0.9.1"],
-                "location": "https://github.com/jagracar/tezos-smart-contracts/blob/main/python/contracts/extendedFa2Contract.py"
-            },
-            "interfaces": ["TZIP-012", "TZIP-016"],
-            "views": [
-                self.get_balance,
-                self.total_supply,
-                self.all_tokens,
-                self.is_operator,
-                self.token_metadata,
-                self.token_data,
-                self.token_royalties],
-            "permissions": {
-                "operator": "owner-or-operator-transfer",
-                "receiver": "owner-no-hook",
-                "sender": "owner-no-hook"
-            }
-        }
+        # Only the views are added here, since they are bound methods and
+        # cannot be part of the static class-level metadata
+        contract_metadata = dict(FA2.CONTRACT_METADATA_BASE)
+        contract_metadata["views"] = [
+            self.get_balance,
+            self.total_supply,
+            self.all_tokens,
+            self.is_operator,
+            self.token_metadata,
+            self.token_data,
+            self.token_royalties]
 
         self.init_metadata("contract_metadata", contract_metadata)
 
@@ -183,6 +189,9 @@ class FA2(sp.Contract):
                     ("to_", ("token_id", "amount"))))).layout(
                         ("from_", "txs"))))
 
+        # Read the sender address only once instead of at each loop iteration
+        sender = sp.compute(sp.sender)
+
         # Loop over the list of transfers
         with sp.for_("transfer", params) as transfer:
             with sp.for_("tx", transfer.txs) as tx:
@@ -193,10 +202,10 @@ class FA2(sp.Contract):
                 # Check that the sender is one of the token operators
                 owner = sp.compute(transfer.from_)
                 sp.verify(
-                    (sp.sender == owner) | 
+                    (sender == owner) |
                     self.data.operators.contains(sp.record(
                         owner=owner,
-                        operator=sp.sender,
+                        operator=sender,
                         token_id=token_id)),
                     message="FA2_NOT_OPERATOR")
 
@@ -252,6 +261,9 @@ class FA2(sp.Contract):
             add_operator=FA2.OPERATOR_KEY_TYPE,
             remove_operator=FA2.OPERATOR_KEY_TYPE)))
 
+        # Read the sender address only once instead of at each loop iteration
+        sender = sp.compute(sp.sender)
+
         # Loop over the list of update operators
         with sp.for_("update_operator", params) as update_operator:
             with update_operator.match_cases() as arg:
@@ -260,7 +272,7 @@ class FA2(sp.Contract):
                     self.check_token_exists(operator_key.token_id)
 
                     # Check that the sender is the token owner
-                    sp.verify(sp.sender == operator_key.owner,
+                    sp.verify(sender == operator_key.owner,
                               message="FA2_SENDER_IS_NOT_OWNER")
 
                     # Add the new operator to the operators big map
@@ -270,7 +282,7 @@ class FA2(sp.Contract):
                     self.check_token_exists(operator_key.token_id)
 
                     # Check that the sender is the token owner
-                    sp.verify(sp.sender == operator_key.owner,
+                    sp.verify(sender == operator_key.owner,
                               message="FA2_SENDER_IS_NOT_OWNER")
 
                     # Remove the operator from the operators big map
@@ -296,13 +308,12 @@ class FA2(sp.Contract):
         responsabilities.
 
         """
-        # Check that there is a proposed administrator
-        sp.verify(self.data.proposed_administrator.is_some(),
-                  message="FA_NO_NEW_ADMIN")
-
-        # Check that the proposed administrator executed the entry point
-        sp.verify(sp.sender == self.data.proposed_administrator.open_some(),
-                  message="FA_NOT_PROPOSED_ADMIN")
+        # Check that there is a proposed administrator and that it executed
+        # the entry point, unwrapping the option in a single step
+        sp.verify(
+            sp.sender == self.data.proposed_administrator.open_some(
+                message="FA_NO_NEW_ADMIN"),
+            message="FA_NOT_PROPOSED_ADMIN")
 
         # Set the new administrator address
         self.data.administrator = sp.sender
@@ -326,17 +337,6 @@ class FA2(sp.Contract):
         # Update the contract metadata
         self.data.metadata[params.k] = params.v
 
-    @sp.onchain_view(pure=True)
-    def token_exists(self, token_id):
-        """Checks if the token exists.
-
-        """
-        # Define the input parameter data type
-        sp.set_type(token_id, sp.TNat)
-
-        # Return true if the token exists
-        sp.result(token_id < self.data.counter)
-
     @sp.onchain_view(pure=True)
     def count_tokens(self):
         """Returns how many tokens are in this FA2 contract.
@@ -19,10 +19,6 @@ class FA2(sp.Contract):
         # The token id
         sp.TNat)
 
-    LEDGER_VALUE_TYPE = sp.TRecord(
-        # The number of token editions that the owner has
-        balance=sp.TNat)
-
     TOKEN_METADATA_VALUE_TYPE = sp.TRecord(
         # The token id
         token_id=sp.TNat,
@@ -39,6 +35,29 @@ class FA2(sp.Contract):
         token_id=sp.TNat).layout(
             ("owner", ("operator", "token_id")))
 
+    # The static part of the TZIP-016 contract metadata
+    # It is built only once, instead of at each contract instantiation
+    CONTRACT_METADATA_BASE = {
+        "name": "Simplified FA2 template contract",
+        "description" : "This contract tries to simplify the FA2 " +
+            "contract template example in smartpy.io v0.9.0",
+        "version": "v1.0.0",
+        "authors": [
+            "Seb Mondet <https://seb.mondet.org>",
+            "Javier Gracia Carpio <https://twitter.com/jagracar>"],
+        "homepage": "https://github.com/jagracar/tezos-smart-contracts",
+        "source": {
+            "tools": ["SmartPy 0.9.0"],
+            "location": "https://github.com/jagracar/tezos-smart-contracts/blob/main/python/contracts/fa2Contract.py"
+        },
+        "interfaces": ["TZIP-012", "TZIP-016"],
+        "permissions": {
+            "operator": "owner-or-operator-transfer",
+            "receiver": "owner-no-hook",
+            "sender": "owner-no-hook"
+        }
+    }
+
     def __init__(self, administrator, metadata):
         """Initializes the contract.
 
@@ -50,7 +69,7 @@ class FA2(sp.Contract):
             # The contract metadata
             metadata=sp.TBigMap(sp.TString, sp.TBytes),
             # The ledger bigmap where the token owners are listed
-            ledger=sp.TBigMap(FA2.LEDGER_KEY_TYPE, FA2.LEDGER_VALUE_TYPE),
+            ledger=sp.TBigMap(FA2.LEDGER_KEY_TYPE, sp.TNat),
             # The tokens total supply
             total_supply=sp.TBigMap(sp.TNat, sp.TNat),
             # The tokens metadata big map
@@ -79,33 +98,16 @@ class FA2(sp.Contract):
 
         # Build the TZIP-016 contract metadata
         # This is helpful to get the off-chain views code in json format
-        contract_metadata = {
-            "name": "Simplified FA2 template contract",
-            "description" : "This contract tries to simplify the FA2 " + 
-                "contract template example in smartpy.io v0.9.0",
-            "version": "v1.0.0",
-            "authors": [
-                "Seb Mondet <https://seb.mondet.org>",
-                "Javier Gracia Carpio <https://twitter.com/jagracar>"],
-            "homepage": "https://github.com/jagracar/tezos-smart-contracts",
-            "source": {
-                "tools": ["SmartPy 0.9.0"],
-                "location": "https://github.com/jagracar/tezos-smart-contracts/blob/main/python/contracts/fa2Contract.py"
-            },
-            "interfaces": ["TZIP-012", "TZIP-016"],
-            "views": [
-                self.get_balance,
-                self.does_token_exist,
-                self.count_tokens,
-                self.all_tokens,
-                self.total_supply,
-                self.is_operator],
-            "permissions": {
-                "operator": "owner-or-operator-transfer",
-                "receiver": "owner-no-hook",
-                "sender": "owner-no-hook"
-            }
-        }
+        # Only the views are added here, since they are bound methods and
+        # cannot be part of the static class-level metadata
+        contract_metadata = dict(FA2.CONTRACT_METADATA_BASE)
+        contract_metadata["views"] = [
+            self.get_balance,
+            self.does_token_exist,
+            self.count_tokens,
+            self.all_tokens,
+            self.total_supply,
+            self.is_operator]
 
         self.init_metadata("contract_metadata", contract_metadata)
 
@@ -146,7 +148,7 @@ class FA2(sp.Contract):
         """Checks that the owner has enough editions of the given token.
 
         """
-        sp.verify(self.data.ledger[(owner, token_id)].balance >= amount,
+        sp.verify(self.data.ledger[(owner, token_id)] >= amount,
                   message="FA2_INSUFFICIENT_BALANCE")
 
     def check_is_not_paused(self):
@@ -175,9 +177,9 @@ class FA2(sp.Contract):
         ledger_key = sp.pair(params.address, params.token_id)
 
         with sp.if_(self.data.ledger.contains(ledger_key)):
-            self.data.ledger[ledger_key].balance += params.amount
+            self.data.ledger[ledger_key] += params.amount
         with sp.else_():
-            self.data.ledger[ledger_key] = sp.record(balance=params.amount)
+            self.data.ledger[ledger_key] = params.amount
 
         # Update the total supply and token metadata big maps
         with sp.if_(params.token_id < self.data.all_tokens):
@@ -230,16 +232,16 @@ class FA2(sp.Contract):
 
                     # Remove the token amount from the owner
                     owner_key = sp.pair(transfer.from_, tx.token_id)
-                    self.data.ledger[owner_key].balance = sp.as_nat(
-                        self.data.ledger[owner_key].balance - tx.amount)
+                    self.data.ledger[owner_key] = sp.as_nat(
+                        self.data.ledger[owner_key] - tx.amount)
 
                     # Add the token amount to the new owner
                     new_owner_key = sp.pair(tx.to_, tx.token_id)
 
                     with sp.if_(self.data.ledger.contains(new_owner_key)):
-                        self.data.ledger[new_owner_key].balance += tx.amount
+                        self.data.ledger[new_owner_key] += tx.amount
                     with sp.else_():
-                         self.data.ledger[new_owner_key] = sp.record(balance=tx.amount)
+                         self.data.ledger[new_owner_key] = tx.amount
 
     @sp.entry_point
     def balance_of(self, params):
@@ -264,21 +266,14 @@ class FA2(sp.Contract):
             # Check that the token exists
             self.check_token_exists(request.token_id)
 
-            # Check if the owner has the token or had it in the past
-            ledger_key = sp.pair(request.owner, request.token_id)
-
-            with sp.if_(self.data.ledger.contains(ledger_key)):
-                sp.result(sp.record(
-                    request=sp.record(
-                        owner=request.owner,
-                        token_id=request.token_id),
-                    balance=self.data.ledger[ledger_key].balance))
-            with sp.else_():
-                sp.result(sp.record(
-                    request=sp.record(
-                        owner=request.owner,
-                        token_id=request.token_id),
-                    balance=0))
+            # Return the owner token balance, defaulting to zero if the owner
+            # never had the token
+            sp.result(sp.record(
+                request=sp.record(
+                    owner=request.owner,
+                    token_id=request.token_id),
+                balance=self.data.ledger.get(
+                    sp.pair(request.owner, request.token_id), 0)))
 
         responses = sp.local("responses", params.requests.map(process_request))
         sp.transfer(responses.value, sp.mutez(0), params.callback)
@@ -367,7 +362,7 @@ class FA2(sp.Contract):
         self.check_token_exists(params.token_id)
 
         # Return the owner token balance
-        sp.result(self.data.ledger[(params.owner, params.token_id)].balance)
+        sp.result(self.data.ledger[(params.owner, params.token_id)])
 
     @sp.offchain_view(pure=True)
     def does_token_exist(self, token_id):
@@ -72,6 +72,23 @@ class ManagerContract(sp.Contract):
         self.check_is_manager()
         self.data.rescue_accounts.add(params)
 
+    @sp.entry_point
+    def add_rescue_accounts(self, params):
+        """Adds a list of accounts to the rescue accounts.
+
+        Batching the additions in a single operation pays the transaction
+        baseline fee only once.
+
+        """
+        # Define the input parameter data type
+        sp.set_type(params, sp.TList(sp.TAddress))
+
+        # Add the new rescue accounts
+        self.check_is_manager()
+
+        with sp.for_("rescue_account", params) as rescue_account:
+            self.data.rescue_accounts.add(rescue_account)
+
     @sp.entry_point
     def remove_rescue_account(self, params):
         """Removes an account from the rescue accounts.
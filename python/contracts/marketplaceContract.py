@@ -140,7 +140,8 @@ class MarketplaceContract(sp.Contract):
             token_amount=params.editions)
 
         # Update the swaps bigmap with the new swap information
-        self.data.swaps[self.data.counter] = sp.record(
+        swap_id = sp.compute(self.data.counter)
+        self.data.swaps[swap_id] = sp.record(
             issuer=sp.sender,
             token_id=params.token_id,
             editions=params.editions,
@@ -148,7 +149,7 @@ class MarketplaceContract(sp.Contract):
             donations=donations.value)
 
         # Increase the swaps counter
-        self.data.counter += 1
+        self.data.counter = swap_id + 1
 
     @sp.entry_point
     def collect(self, swap_id):
@@ -329,13 +330,12 @@ class MarketplaceContract(sp.Contract):
         responsabilities.
 
         """
-        # Check that there is a proposed administrator
-        sp.verify(self.data.proposed_administrator.is_some(),
-                  message="MP_NO_NEW_ADMIN")
-
-        # Check that the proposed administrator executed the entry point
-        sp.verify(sp.sender == self.data.proposed_administrator.open_some(),
-                  message="MP_NOT_PROPOSED_ADMIN")
+        # Check that there is a proposed administrator and that it executed
+        # the entry point, unwrapping the option in a single step
+        sp.verify(
+            sp.sender == self.data.proposed_administrator.open_some(
+                message="MP_NO_NEW_ADMIN"),
+            message="MP_NOT_PROPOSED_ADMIN")
 
         # Check that no tez have been transferred
         self.check_no_tez_transfer()
@@ -406,11 +406,33 @@ class MarketplaceContract(sp.Contract):
         # Define the input parameter data type
         sp.set_type(swap_id, sp.TNat)
 
-        # Check that the swap id is present in the swaps big map
-        sp.verify(self.data.swaps.contains(swap_id), message="MP_WRONG_SWAP_ID")
-
         # Return the swap information
-        sp.result(self.data.swaps[swap_id])
+        # A single big map lookup both checks that the swap id is present in
+        # the swaps big map and returns its information
+        sp.result(self.data.swaps.get(swap_id, message="MP_WRONG_SWAP_ID"))
+
+    @sp.onchain_view()
+    def get_swaps(self, swap_ids):
+        """Returns the complete information from a list of swap ids.
+
+        Batching the lookups in a single view call pays the view call
+        overhead only once.
+
+        """
+        # Define the input parameter data type
+        sp.set_type(swap_ids, sp.TList(sp.TNat))
+
+        # Collect the information from all the requested swaps
+        swaps = sp.local(
+            "swaps", sp.map({}, tkey=sp.TNat,
+                            tvalue=MarketplaceContract.SWAP_TYPE))
+
+        with sp.for_("swap_id", swap_ids) as swap_id:
+            swaps.value[swap_id] = self.data.swaps.get(
+                swap_id, message="MP_WRONG_SWAP_ID")
+
+        # Return the swaps information
+        sp.result(swaps.value)
 
     @sp.onchain_view()
     def get_swaps_counter(self):
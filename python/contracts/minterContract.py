@@ -115,13 +115,12 @@ class MinterContract(sp.Contract):
         responsabilities.
 
         """
-        # Check that there is a proposed administrator
-        sp.verify(self.data.proposed_administrator.is_some(),
-                  message="MINTER_NO_NEW_ADMIN")
-
-        # Check that the proposed administrator executed the entry point
-        sp.verify(sp.sender == self.data.proposed_administrator.open_some(),
-                  message="MINTER_NOT_PROPOSED_ADMIN")
+        # Check that there is a proposed administrator and that it executed
+        # the entry point, unwrapping the option in a single step
+        sp.verify(
+            sp.sender == self.data.proposed_administrator.open_some(
+                message="MINTER_NO_NEW_ADMIN"),
+            message="MINTER_NOT_PROPOSED_ADMIN")
 
         # Set the new administrator address
         self.data.administrator = sp.sender
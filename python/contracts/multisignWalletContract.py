@@ -189,12 +189,12 @@ class MultisigWalletContract(sp.Contract):
             the proposal parameters.
 
         """
-        # Check that the proposal id is present in the proposals big map
-        sp.verify(self.data.proposals.contains(proposal_id),
-                  message="MS_INEXISTENT_PROPOSAL")
+        # A single big map lookup both checks that the proposal id is present
+        # in the proposals big map and returns the proposal information
+        proposal = sp.compute(self.data.proposals.get(
+            proposal_id, message="MS_INEXISTENT_PROPOSAL"))
 
         # Check that the proposal has not been executed
-        proposal = self.data.proposals[proposal_id]
         sp.verify(~proposal.executed, message="MS_EXECUTED_PROPOSAL")
 
         # Check that the proposal has not expired
@@ -228,7 +228,8 @@ class MultisigWalletContract(sp.Contract):
 
         """
         # Update the proposals bigmap with the new proposal information
-        self.data.proposals[self.data.counter] = sp.record(
+        proposal_id = sp.compute(self.data.counter)
+        self.data.proposals[proposal_id] = sp.record(
             kind=sp.variant(kind, sp.unit),
             executed=False,
             issuer=sp.sender,
@@ -243,7 +244,7 @@ class MultisigWalletContract(sp.Contract):
             lambda_function=lambda_function)
 
         # Increase the proposals counter
-        self.data.counter += 1
+        self.data.counter = proposal_id + 1
 
     @sp.entry_point
     def default(self, unit):
@@ -620,12 +621,11 @@ class MultisigWalletContract(sp.Contract):
         # Define the input parameter data type
         sp.set_type(proposal_id, sp.TNat)
 
-        # Check that the proposal id is present in the proposals big map
-        sp.verify(self.data.proposals.contains(proposal_id),
-                  message="MS_INEXISTENT_PROPOSAL")
-
         # Return the proposal information
-        sp.result(self.data.proposals[proposal_id])
+        # A single big map lookup both checks that the proposal id is present
+        # in the proposals big map and returns its information
+        sp.result(self.data.proposals.get(
+            proposal_id, message="MS_INEXISTENT_PROPOSAL"))
 
     @sp.onchain_view()
     def get_vote(self, vote):
@@ -651,12 +651,11 @@ class MultisigWalletContract(sp.Contract):
             proposal_id=sp.TNat,
             user=sp.TAddress).layout(("proposal_id", "user")))
 
-        # Check that the vote is present in the votes big map
-        sp.verify(self.data.votes.contains((vote.proposal_id, vote.user)),
-                  message="MS_NO_USER_VOTE")
-
         # Return the user's vote
-        sp.result(self.data.votes[(vote.proposal_id, vote.user)])
+        # A single big map lookup both checks that the vote is present in the
+        # votes big map and returns its value
+        sp.result(self.data.votes.get(
+            (vote.proposal_id, vote.user), message="MS_NO_USER_VOTE"))
 
     @sp.onchain_view()
     def has_voted(self, vote):
@@ -58,16 +58,17 @@ class NonCustodialBarterContract(sp.Contract):
         the trade is still open (not executed and not cancelled).
 
         """
-        # Check that the trade id is present in the trades big map
-        sp.verify(self.data.trades.contains(trade_id),
-                  message="The provided trade id doesn't exist")
+        # A single big map lookup both checks that the trade id is present in
+        # the trades big map and returns the trade information
+        trade = sp.compute(self.data.trades.get(
+            trade_id, message="The provided trade id doesn't exist"))
 
         # Check that the trade was not executed
-        sp.verify(~self.data.trades[trade_id].executed,
+        sp.verify(~trade.executed,
                   message="The trade was executed")
 
         # Check that the trade was not cancelled
-        sp.verify(~self.data.trades[trade_id].cancelled,
+        sp.verify(~trade.cancelled,
                   message="The trade was cancelled")
 
     @sp.entry_point
@@ -85,17 +86,9 @@ class NonCustodialBarterContract(sp.Contract):
         # Check that no tez have been transferred
         self.check_no_tez_transfer()
 
-        # Check that the trade will involve at least one edition of each token
-        with sp.for_("token", trade_proposal.tokens) as token:
-            sp.verify(token.amount >= 0,
-                      message="At least one token edition needs to be traded")
-
-        with sp.for_("token", trade_proposal.for_tokens) as token:
-            sp.verify(token.amount >= 0,
-                      message="At least one token edition needs to be traded")
-
         # Update the trades bigmap with the new trade information
-        self.data.trades[self.data.counter] = sp.record(
+        trade_id = sp.compute(self.data.counter)
+        self.data.trades[trade_id] = sp.record(
             executed=False,
             cancelled=False,
             user1=sp.sender,
@@ -104,7 +97,7 @@ class NonCustodialBarterContract(sp.Contract):
             tokens2=trade_proposal.for_tokens)
 
         # Increase the trades counter
-        self.data.counter += 1
+        self.data.counter = trade_id + 1
 
     @sp.entry_point
     def accept_trade(self, trade_id):
@@ -227,8 +227,10 @@ class CourtContract(sp.Contract):
         sp.verify(game.players.contains(sp.sender))
 
         # Check that both players accecpted to play the game
-        sp.verify(game.players[sp.sender].accepted)
-        opponent = game.players[sp.sender].opponent
+        # The sender player information is read only once from the players map
+        player = sp.compute(game.players[sp.sender])
+        sp.verify(player.accepted)
+        opponent = player.opponent
         sp.verify(game.players[opponent].accepted)
 
         # Check that the game didn't start yet
@@ -8,7 +8,7 @@ import smartpy as sp
 barterContract = sp.io.import_script_from_url(
     "file:python/contracts/barterContract.py")
 fa2Contract = sp.io.import_script_from_url(
-    "file:python/templates/fa2Contract.py")
+    "file:python/contracts/fa2Contract.py")
 
 
 def get_test_environment():
@@ -23,12 +23,10 @@ def get_test_environment():
 
     # Initialize the two FA2 contracts
     fa2_1 = fa2Contract.FA2(
-        config=fa2Contract.FA2_config(),
-        admin=fa2_admin.address,
+        administrator=fa2_admin.address,
         metadata=sp.utils.metadata_of_url("ipfs://aaa"))
     fa2_2 = fa2Contract.FA2(
-        config=fa2Contract.FA2_config(),
-        admin=fa2_admin.address,
+        administrator=fa2_admin.address,
         metadata=sp.utils.metadata_of_url("ipfs://bbb"))
     scenario += fa2_1
     scenario += fa2_2
@@ -36,7 +34,7 @@ def get_test_environment():
     # Initialize the barter contract
     barter = barterContract.BarterContract(
         manager=admin.address,
-        allowed_fa2s=sp.big_map({fa2_1.address : True}))
+        allowed_fa2s=sp.map({fa2_1.address : True}))
     scenario += barter
 
     # Save all the variables in a test environment dictionary
@@ -131,16 +129,16 @@ def test_execute_trade():
 
     # Add the barter contract as operator for the tokens
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user2.address,
             operator=barter.address,
             token_id=2))]).run(sender=user2)
@@ -197,16 +195,16 @@ def test_cancel_trade():
 
     # Add the barter contract as operator for the tokens
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user2.address,
             operator=barter.address,
             token_id=2))]).run(sender=user2)
@@ -103,8 +103,6 @@ def test_mint():
     scenario.verify(fa2.token_royalties(0).minter.royalties == 0)
     scenario.verify(fa2.token_royalties(0).creator.address == user2.address)
     scenario.verify(fa2.token_royalties(0).creator.royalties == 50)
-    scenario.verify(fa2.token_exists(0))
-    scenario.verify(~fa2.token_exists(1))
     scenario.verify(fa2.count_tokens() == 1)
     scenario.verify(sp.len(fa2.all_tokens()) == 1)
 
@@ -155,9 +153,6 @@ def test_mint():
     scenario.verify(fa2.token_royalties(1).minter.royalties == 10)
     scenario.verify(fa2.token_royalties(1).creator.address == user2.address)
     scenario.verify(fa2.token_royalties(1).creator.royalties == 100)
-    scenario.verify(fa2.token_exists(0))
-    scenario.verify(fa2.token_exists(1))
-    scenario.verify(~fa2.token_exists(2))
     scenario.verify(fa2.count_tokens() == 2)
     scenario.verify(sp.len(fa2.all_tokens()) == 2)
 
@@ -100,7 +100,7 @@ def test_mint():
         token_id=token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == editions)
+    scenario.verify(fa2.data.ledger[(address, token_id)] == editions)
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.data.token_metadata[token_id].token_id == token_id)
     scenario.verify(fa2.data.token_metadata[token_id].token_info[""] == metadata[""])
@@ -121,7 +121,7 @@ def test_mint():
         token_id=token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == 2 * editions)
+    scenario.verify(fa2.data.ledger[(address, token_id)] == 2 * editions)
     scenario.verify(fa2.data.total_supply[token_id] == 2 * editions)
     scenario.verify(fa2.total_supply(token_id) == 2 * editions)
 
@@ -142,8 +142,8 @@ def test_mint():
         token_id=token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == 2 * editions)
-    scenario.verify(fa2.data.ledger[(new_address, token_id)].balance == editions)
+    scenario.verify(fa2.data.ledger[(address, token_id)] == 2 * editions)
+    scenario.verify(fa2.data.ledger[(new_address, token_id)] == editions)
     scenario.verify(fa2.data.total_supply[token_id] == 3 * editions)
     scenario.verify(fa2.data.token_metadata[token_id].token_info[""] == metadata[""])
     scenario.verify(fa2.data.all_tokens == token_id + 1)
@@ -160,8 +160,8 @@ def test_mint():
         token_id=token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == 2 * editions)
-    scenario.verify(fa2.data.ledger[(new_address, token_id)].balance == editions)
+    scenario.verify(fa2.data.ledger[(address, token_id)] == 2 * editions)
+    scenario.verify(fa2.data.ledger[(new_address, token_id)] == editions)
     scenario.verify(fa2.data.total_supply[token_id] == 3 * editions)
     scenario.verify(sp.len(fa2.all_tokens()) == 1)
     scenario.verify(fa2.total_supply(token_id) == 3 * editions)
@@ -183,9 +183,9 @@ def test_mint():
         token_id=new_token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == 2 * editions)
-    scenario.verify(fa2.data.ledger[(new_address, token_id)].balance == editions)
-    scenario.verify(fa2.data.ledger[(new_address, new_token_id)].balance == new_editions)
+    scenario.verify(fa2.data.ledger[(address, token_id)] == 2 * editions)
+    scenario.verify(fa2.data.ledger[(new_address, token_id)] == editions)
+    scenario.verify(fa2.data.ledger[(new_address, new_token_id)] == new_editions)
     scenario.verify(fa2.data.total_supply[token_id] == 3 * editions)
     scenario.verify(fa2.data.total_supply[new_token_id] == new_editions)
     scenario.verify(fa2.data.token_metadata[token_id].token_id == token_id)
@@ -222,7 +222,7 @@ def test_transfer():
         token_id=token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions)
+    scenario.verify(fa2.data.ledger[(user1.address, token_id)] == editions)
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.data.token_metadata[token_id].token_id == token_id)
     scenario.verify(fa2.total_supply(token_id) == editions)
@@ -242,8 +242,8 @@ def test_transfer():
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 3)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 3)
+    scenario.verify(fa2.data.ledger[(user1.address, token_id)] == editions - 3)
+    scenario.verify(fa2.data.ledger[(user3.address, token_id)] == 3)
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -255,9 +255,9 @@ def test_transfer():
         ]).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 6)
-    scenario.verify(fa2.data.ledger[(user2.address, token_id)].balance == 3)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 3)
+    scenario.verify(fa2.data.ledger[(user1.address, token_id)] == editions - 6)
+    scenario.verify(fa2.data.ledger[(user2.address, token_id)] == 3)
+    scenario.verify(fa2.data.ledger[(user3.address, token_id)] == 3)
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -288,9 +288,9 @@ def test_transfer():
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 6)
-    scenario.verify(fa2.data.ledger[(user2.address, token_id)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 4)
+    scenario.verify(fa2.data.ledger[(user1.address, token_id)] == editions - 6)
+    scenario.verify(fa2.data.ledger[(user2.address, token_id)] == 2)
+    scenario.verify(fa2.data.ledger[(user3.address, token_id)] == 4)
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -308,9 +308,9 @@ def test_transfer():
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 6 - 5)
-    scenario.verify(fa2.data.ledger[(user2.address, token_id)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 4 + 5)
+    scenario.verify(fa2.data.ledger[(user1.address, token_id)] == editions - 6 - 5)
+    scenario.verify(fa2.data.ledger[(user2.address, token_id)] == 2)
+    scenario.verify(fa2.data.ledger[(user3.address, token_id)] == 4 + 5)
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -339,8 +339,8 @@ def test_complex_transfer():
         token_id=1).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20)
+    scenario.verify(fa2.data.ledger[(user1.address, 0)] == 10)
+    scenario.verify(fa2.data.ledger[(user2.address, 1)] == 20)
     scenario.verify(fa2.data.total_supply[0] == 10)
     scenario.verify(fa2.data.total_supply[1] == 20)
 
@@ -364,10 +364,10 @@ def test_complex_transfer():
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 3)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20)
+    scenario.verify(fa2.data.ledger[(user1.address, 0)] == 10 - 2 - 3)
+    scenario.verify(fa2.data.ledger[(user2.address, 0)] == 2)
+    scenario.verify(fa2.data.ledger[(user3.address, 0)] == 3)
+    scenario.verify(fa2.data.ledger[(user2.address, 1)] == 20)
 
     # Check that the admin can transfer whatever token they want
     fa2.transfer([
@@ -380,11 +380,11 @@ def test_complex_transfer():
         ]).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3 - 1)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 4)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20 - 5)
-    scenario.verify(fa2.data.ledger[(user3.address, 1)].balance == 5)
+    scenario.verify(fa2.data.ledger[(user1.address, 0)] == 10 - 2 - 3 - 1)
+    scenario.verify(fa2.data.ledger[(user2.address, 0)] == 2)
+    scenario.verify(fa2.data.ledger[(user3.address, 0)] == 4)
+    scenario.verify(fa2.data.ledger[(user2.address, 1)] == 20 - 5)
+    scenario.verify(fa2.data.ledger[(user3.address, 1)] == 5)
 
     # Check that owners can transfer tokens to themselves
     fa2.transfer([
@@ -397,11 +397,11 @@ def test_complex_transfer():
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3 - 1)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 4)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20 - 5)
-    scenario.verify(fa2.data.ledger[(user3.address, 1)].balance == 5)
+    scenario.verify(fa2.data.ledger[(user1.address, 0)] == 10 - 2 - 3 - 1)
+    scenario.verify(fa2.data.ledger[(user2.address, 0)] == 2)
+    scenario.verify(fa2.data.ledger[(user3.address, 0)] == 4)
+    scenario.verify(fa2.data.ledger[(user2.address, 1)] == 20 - 5)
+    scenario.verify(fa2.data.ledger[(user3.address, 1)] == 5)
 
     # Make the second user as operator of the first user token
     fa2.update_operators([sp.variant("add_operator", sp.record(
@@ -420,11 +420,11 @@ def test_complex_transfer():
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3 - 1 - 2)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 4 + 2)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20 - 5 - 1)
-    scenario.verify(fa2.data.ledger[(user3.address, 1)].balance == 5 + 1)
+    scenario.verify(fa2.data.ledger[(user1.address, 0)] == 10 - 2 - 3 - 1 - 2)
+    scenario.verify(fa2.data.ledger[(user2.address, 0)] == 2)
+    scenario.verify(fa2.data.ledger[(user3.address, 0)] == 4 + 2)
+    scenario.verify(fa2.data.ledger[(user2.address, 1)] == 20 - 5 - 1)
+    scenario.verify(fa2.data.ledger[(user3.address, 1)] == 5 + 1)
 
 
 @sp.add_test(name="Test balance of")
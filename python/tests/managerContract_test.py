@@ -90,7 +90,7 @@ def test_update_manager():
 
 
 @sp.add_test(name="Test update rescue accounts")
-def test_update_manager():
+def test_update_rescue_accounts():
     # Define the test accounts
     user_1 = sp.test_account("user_1")
     user_2 = sp.test_account("user_2")
@@ -136,8 +136,34 @@ def test_update_manager():
     scenario.verify(sp.len(c.data.rescue_accounts) == 2)
 
 
+@sp.add_test(name="Test add rescue accounts")
+def test_add_rescue_accounts():
+    # Define the test accounts
+    user_1 = sp.test_account("user_1")
+    user_2 = sp.test_account("user_2")
+    user_3 = sp.test_account("user_3")
+
+    # Initialize the contract
+    c = managerContract.ManagerContract(user_1.address)
+
+    # Add the contract to the test scenario
+    scenario = sp.test_scenario()
+    scenario += c
+
+    # Add user 2 and user 3 to the rescue accounts in a single operation
+    c.add_rescue_accounts([user_2.address, user_3.address]).run(sender=user_1)
+    scenario.verify(c.data.rescue_accounts.contains(user_2.address))
+    scenario.verify(c.data.rescue_accounts.contains(user_3.address))
+    scenario.verify(sp.len(c.data.rescue_accounts) == 2)
+
+    # Check that only the manager can add rescue accounts
+    c.add_rescue_accounts([user_1.address]).run(valid=False, sender=user_3)
+    scenario.verify(~c.data.rescue_accounts.contains(user_1.address))
+    scenario.verify(sp.len(c.data.rescue_accounts) == 2)
+
+
 @sp.add_test(name="Test rescue mode")
-def test_update_manager():
+def test_rescue_mode():
     # Define the test accounts
     user_1 = sp.test_account("user_1")
     user_2 = sp.test_account("user_2")
@@ -2,7 +2,6 @@
 
 """
 
-import os
 import smartpy as sp
 
 # Import the extendedFa2Contract, minterContract and marketplaceContract modules
@@ -196,6 +195,8 @@ def test_swap_and_collect():
     scenario.verify(marketplace.get_swap(0).editions == swapped_editions)
     scenario.verify(marketplace.get_swap(0).price == price)
     scenario.verify(sp.len(marketplace.get_swap(0).donations) == 2)
+    scenario.verify(sp.len(marketplace.get_swaps([0])) == 1)
+    scenario.verify(marketplace.get_swaps([0])[0].issuer == artist1.address)
     scenario.verify(marketplace.get_swaps_counter() == 1)
 
     # Check that collecting fails if the collector is the swap issuer
@@ -8,7 +8,7 @@ import smartpy as sp
 multisigWalletContract = sp.io.import_script_from_url(
     "file:python/contracts/multisignWalletContract.py")
 fa2Contract = sp.io.import_script_from_url(
-    "file:python/templates/fa2Contract.py")
+    "file:python/contracts/fa2Contract.py")
 
 
 class RecipientContract(sp.Contract):
@@ -342,8 +342,7 @@ def test_transfer_token_proposal():
     # Create the FA2 token contract and add it to the test scenario
     admin = sp.test_account("admin")
     fa2 = fa2Contract.FA2(
-        config=fa2Contract.FA2_config(),
-        admin=admin.address,
+        administrator=admin.address,
         metadata=sp.utils.metadata_of_url("ipfs://aaa"))
     scenario += fa2
 
@@ -363,8 +362,8 @@ def test_transfer_token_proposal():
             amount=20)]))])).run(sender=user1)
 
     # Check that the token ledger information is correct
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 100 - 20)
-    scenario.verify(fa2.data.ledger[(multisig.address, 0)].balance == 20)
+    scenario.verify(fa2.data.ledger[(user1.address, 0)] == 100 - 20)
+    scenario.verify(fa2.data.ledger[(multisig.address, 0)] == 20)
 
     # Create the accounts that will receive the token transfers
     receptor1 = sp.test_account("receptor1")
@@ -392,10 +391,10 @@ def test_transfer_token_proposal():
     scenario.verify(multisig.data.proposals[0].executed)
 
     # Check that the token ledger information is correct
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 100 - 20)
-    scenario.verify(fa2.data.ledger[(multisig.address, 0)].balance == 20 - 5 - 1)
-    scenario.verify(fa2.data.ledger[(receptor1.address, 0)].balance == 5)
-    scenario.verify(fa2.data.ledger[(receptor2.address, 0)].balance == 1)
+    scenario.verify(fa2.data.ledger[(user1.address, 0)] == 100 - 20)
+    scenario.verify(fa2.data.ledger[(multisig.address, 0)] == 20 - 5 - 1)
+    scenario.verify(fa2.data.ledger[(receptor1.address, 0)] == 5)
+    scenario.verify(fa2.data.ledger[(receptor2.address, 0)] == 1)
 
 
 @sp.add_test(name="Test minimum votes proposal")
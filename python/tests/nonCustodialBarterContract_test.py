@@ -8,7 +8,7 @@ import smartpy as sp
 nonCustodialBarterContract = sp.io.import_script_from_url(
     "file:python/contracts/nonCustodialBarterContract.py")
 fa2Contract = sp.io.import_script_from_url(
-    "file:python/templates/fa2Contract.py")
+    "file:python/contracts/fa2Contract.py")
 
 
 def get_test_environment():
@@ -20,12 +20,10 @@ def get_test_environment():
 
     # Initialize the two FA2 contracts
     fa2_1 = fa2Contract.FA2(
-        config=fa2Contract.FA2_config(),
-        admin=fa2_admin.address,
+        administrator=fa2_admin.address,
         metadata=sp.utils.metadata_of_url("ipfs://aaa"))
     fa2_2 = fa2Contract.FA2(
-        config=fa2Contract.FA2_config(),
-        admin=fa2_admin.address,
+        administrator=fa2_admin.address,
         metadata=sp.utils.metadata_of_url("ipfs://bbb"))
 
     # Initialize the non-custodial barter contract
@@ -96,41 +94,41 @@ def test_trade_with_second_user():
 
     # Add the barter contract as operator for the tokens
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_2.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user2.address,
             operator=barter.address,
             token_id=1))]).run(sender=user2)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user3.address,
             operator=barter.address,
             token_id=1))]).run(sender=user3)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 30)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 40)
-    scenario.verify(fa2_2.data.ledger[(user3.address, 1)].balance == 30)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 1)] == 30)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 40)
+    scenario.verify(fa2_2.data.ledger[(user3.address, 1)] == 30)
 
     # Propose a trade with the second user
     barter.propose_trade(
@@ -151,12 +149,12 @@ def test_trade_with_second_user():
         with_user=sp.some(user2.address)).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 30)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 40)
-    scenario.verify(fa2_2.data.ledger[(user3.address, 1)].balance == 30)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 1)] == 30)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 40)
+    scenario.verify(fa2_2.data.ledger[(user3.address, 1)] == 30)
 
     # Check that the first and third users cannot accept the trade because they
     # are not the assigned second user
@@ -168,15 +166,15 @@ def test_trade_with_second_user():
     barter.accept_trade(0).run(sender=user2)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 30 + 10)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 40 - 10)
-    scenario.verify(fa2_2.data.ledger[(user3.address, 1)].balance == 30)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100 - 1)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100 - 2)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100 - 2)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 1)] == 30 + 10)
+    scenario.verify(fa2_1.data.ledger[(user2.address, 0)] == 1)
+    scenario.verify(fa2_1.data.ledger[(user2.address, 1)] == 2)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 0)] == 2)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 40 - 10)
+    scenario.verify(fa2_2.data.ledger[(user3.address, 1)] == 30)
 
     # Check that the second user cannot accept twice the trade
     barter.accept_trade(0).run(valid=False, sender=user2)
@@ -219,30 +217,30 @@ def test_trade_without_second_user():
 
     # Add the barter contract as operator for the tokens
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0))]).run(sender=user1)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user2.address,
             operator=barter.address,
             token_id=1))]).run(sender=user2)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 100)
 
     # Propose a trade with no specific second user
     barter.propose_trade(
@@ -255,10 +253,10 @@ def test_trade_without_second_user():
         with_user=sp.none).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 100)
 
     # Check that the first and third users cannot accept the trade because they
     # don't own the requested token
@@ -269,14 +267,14 @@ def test_trade_without_second_user():
     barter.accept_trade(0).run(sender=user2)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 10)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100 - 10)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100 - 1)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100 - 2)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100 - 2)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 1)] == 10)
+    scenario.verify(fa2_1.data.ledger[(user2.address, 0)] == 1)
+    scenario.verify(fa2_1.data.ledger[(user2.address, 1)] == 2)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 0)] == 2)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 100 - 10)
 
     # Check that the second user cannot accept twice the trade
     barter.accept_trade(0).run(valid=False, sender=user2)
@@ -317,29 +315,29 @@ def test_trade_same_user():
 
     # Add the barter contract as operator for the tokens
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_2.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 1)] == 100)
 
     # Propose a trade with no specific second user
     barter.propose_trade(
@@ -352,19 +350,19 @@ def test_trade_same_user():
         with_user=sp.none).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 1)] == 100)
 
     # The first user accepts its own trade
     barter.accept_trade(0).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 1)] == 100)
 
     # Check that the first user cannot accept twice the trade
     barter.accept_trade(0).run(valid=False, sender=user1)
@@ -406,30 +404,30 @@ def test_cancel_trade():
 
     # Add the barter contract as operator for the tokens
     fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
+        sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=1))]).run(sender=user1)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user1.address,
             operator=barter.address,
             token_id=0))]).run(sender=user1)
     fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
+        [sp.variant("add_operator", sp.record(
             owner=user2.address,
             operator=barter.address,
             token_id=1))]).run(sender=user2)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 100)
 
     # Propose a trade with the second user
     barter.propose_trade(
@@ -442,10 +440,10 @@ def test_cancel_trade():
         with_user=sp.some(user2.address)).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 100)
 
     # Check that the second user cannot cancel the trade
     barter.cancel_trade(0).run(valid=False, sender=user2)
@@ -455,10 +453,10 @@ def test_cancel_trade():
     barter.cancel_trade(0).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_1.data.ledger[(user1.address, 1)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user1.address, 0)] == 100)
+    scenario.verify(fa2_2.data.ledger[(user2.address, 1)] == 100)
 
     # Check that the first user cannot cancel the trade again
     barter.cancel_trade(0).run(valid=False, sender=user1)